@@ -55,7 +55,7 @@ class Employee:
 
 
 class EmployeeRepository:
-    doc_fields = ["name", "employee_name", "custom_time_model", "grade", "date_of_birth", "date_of_joining"]
+    doc_fields = ("name", "employee_name", "custom_time_model", "grade", "date_of_birth", "date_of_joining")
 
     def get_all(self) -> list[Employee]:
         docs_employees = frappe.get_all("Employee", fields=self.doc_fields)
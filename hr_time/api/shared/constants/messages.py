@@ -6,9 +6,14 @@ class Messages:
     class Worklog:
         SUCCESS_WORKLOG_ADDITION = "Worklog added successfully."
         SUCCESS_WORKLOG_CREATION = "Worklog created successfully."
+        SUCCESS_WORKLOGS_CREATION = "Worklogs created successfully."
         ERR_GET_WORKLOG_STATUS = "Error fetching worklog status."
         ERR_CREATE_WORKLOG = "Worklog Creation Error."
         ERR_CREATE_WORKLOG_FUTURE_TIME = "The entered time cannot be in the future."
+        ERR_INVALID_TICKET_LINK = "The external reference must be a valid http(s) URL."
+        ERR_UNKNOWN_EMPLOYEE = "The worklog refers to an Employee that does not exist."
+        ERR_UNKNOWN_TASK = "The worklog refers to a Task that does not exist."
+        ERR_TOO_MANY_WORKLOGS = "At most {0} worklogs can be created at once."
         EMPTY_TASK_DESC = "Task description must not be empty."
         EMPTY_TASK_DESC_WHEN_WORKLOGS = "You have no Worklogs today: Task description must not be empty."
 
@@ -1,5 +1,6 @@
 import frappe
 from frappe import _
+from werkzeug.wrappers import Response as HTTPResponse
 
 
 class FrappeUtils:
@@ -29,3 +30,16 @@ class FrappeUtils:
             error_type (Exception): The type of exception to raise (default is Exception).
         """
         frappe.throw(_(msg), error_type)
+
+    @staticmethod
+    def make_json_response(data: bytes, status_code: int = 200) -> HTTPResponse:
+        """
+        Build an HTTP response from an already serialized JSON body.
+        Frappe passes response objects returned by whitelisted methods on as they are,
+        so the body is not serialized a second time.
+
+        Args:
+            data (bytes): The UTF-8 encoded JSON body.
+            status_code (int): The HTTP status code of the response (default is 200).
+        """
+        return HTTPResponse(data, status=status_code, content_type="application/json")
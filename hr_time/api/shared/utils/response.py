@@ -1,5 +1,5 @@
-import json
-from dataclasses import dataclass, field, asdict
+import orjson
+from dataclasses import dataclass, field
 from typing import Optional, Dict
 
 
@@ -42,4 +42,16 @@ class Response:
 
     def to_json(self) -> str:
         """Converts the response to a JSON string."""
-        return json.dumps(asdict(self))
+        return self.to_bytes().decode()
+
+    def to_bytes(self) -> bytes:
+        """Converts the response to UTF-8 encoded JSON, e.g. for writing directly into an HTTP body."""
+        return orjson.dumps(self._as_dict())
+
+    def to_message_bytes(self) -> bytes:
+        """Converts the response to UTF-8 encoded JSON wrapped in Frappe's `message` envelope."""
+        return orjson.dumps({"message": self._as_dict()})
+
+    def _as_dict(self) -> Dict:
+        """Returns the response fields as a (shallow) dictionary, avoiding the deep copy of `dataclasses.asdict`."""
+        return {"status": self.status, "message": self.message, "data": self.data}
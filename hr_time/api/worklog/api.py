@@ -1,6 +1,13 @@
+from typing import Callable
 import frappe
 from frappe import _
+from werkzeug.wrappers import Response as HTTPResponse
+from hr_time.api import logger
+from hr_time.api.worklog.repository import WorklogValidationError
 from hr_time.api.worklog.service import WorklogService
+from hr_time.api.shared.constants.messages import Messages
+from hr_time.api.shared.utils.frappe_utils import FrappeUtils
+from hr_time.api.shared.utils.response import Response
 
 
 @frappe.whitelist()
@@ -18,7 +25,7 @@ def has_employee_made_worklogs_today(employee_id) -> bool:
 
 
 @frappe.whitelist()
-def create_worklog_now(employee_id, worklog_text, task=None, ticket_link=None) -> dict:
+def create_worklog_now(employee_id, worklog_text, task=None, ticket_link=None) -> HTTPResponse:
     """
     Creates a new worklog for the given employee.
 
@@ -29,11 +36,59 @@ def create_worklog_now(employee_id, worklog_text, task=None, ticket_link=None) -
         ticket_link (Optional[str]): The external reference URL associated with the worklog (if any).
 
     Returns:
-        dict:
-            The response from the WorklogService as JSON string after creating the worklog
-            which include information such as success status, message and (optionally) data.
+        HTTPResponse:
+            The pre-serialized JSON response (wrapped in Frappe's `message` envelope) from the WorklogService
+            after creating the worklog, which includes information such as success status, message and
+            (optionally) data.
     """
-    return WorklogService.prod().create_worklog_now(employee_id, worklog_text, task, ticket_link).to_json()
+    return _create_and_respond(
+        lambda: WorklogService.prod().create_worklog_now(employee_id, worklog_text, task, ticket_link)
+    )
+
+
+@frappe.whitelist()
+def create_worklogs(worklogs, employee_id=None) -> HTTPResponse:
+    """
+    Creates several worklogs (at most `WorklogService.MAX_BATCH_SIZE`) for the given employee at once.
+
+    Args:
+        worklogs (Union[str, List[dict]]): The worklogs to create (JSON encoded when sent as request parameter),
+            each with the keys `worklog_text` and optionally `log_time`, `task` and `ticket_link`.
+        employee_id (Optional[str]): The ID of the employee creating the worklogs.
+            If None, the current employee ID is used.
+
+    Returns:
+        HTTPResponse:
+            The pre-serialized JSON response (wrapped in Frappe's `message` envelope) from the WorklogService
+            after creating the worklogs. If any worklog is invalid, none of them is created.
+    """
+    return _create_and_respond(
+        lambda: WorklogService.prod().create_worklogs(frappe.parse_json(worklogs), employee_id)
+    )
+
+
+def _create_and_respond(create: Callable[[], Response]) -> HTTPResponse:
+    """
+    Single error boundary of the worklog creation: lower layers raise, errors are serialized here.
+
+    Args:
+        create (Callable[[], Response]): Creates the worklog(s) and returns the success response.
+
+    Returns:
+        HTTPResponse: The pre-serialized JSON response of `create`, or an error response if it raised.
+    """
+    try:
+        result = create()
+
+    except WorklogValidationError as ve:
+        logger.error(f"Validation error: {str(ve)}", Messages.Worklog.ERR_CREATE_WORKLOG)
+        result = Response.error(str(ve))
+
+    except Exception as e:
+        logger.error(f"Error : {str(e)}", Messages.Worklog.ERR_CREATE_WORKLOG)
+        result = Response.error(str(e))
+
+    return FrappeUtils.make_json_response(result.to_message_bytes())
 
 
 @frappe.whitelist()
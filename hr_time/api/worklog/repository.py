@@ -1,11 +1,96 @@
-from datetime import datetime, time
-from typing import Optional, List
+import functools
+import re
+from dataclasses import dataclass
+from operator import itemgetter
+from datetime import datetime, time, timedelta, date as date_type
+from typing import Optional, List, Tuple, Union
 import frappe
-from frappe import _, ValidationError
+from frappe import ValidationError
+from frappe.model.naming import make_autoname
 from hr_time.api.shared.constants.messages import Messages
-from hr_time.api.shared.utils.response import Response
 
+# Messages bound once at module level to avoid the nested attribute lookups on every call
+_MSG_EMPTY = Messages.Worklog.EMPTY_TASK_DESC
+_MSG_FUTURE = Messages.Worklog.ERR_CREATE_WORKLOG_FUTURE_TIME
+_MSG_INVALID_LINK = Messages.Worklog.ERR_INVALID_TICKET_LINK
+_MSG_UNKNOWN_EMPLOYEE = Messages.Worklog.ERR_UNKNOWN_EMPLOYEE
+_MSG_UNKNOWN_TASK = Messages.Worklog.ERR_UNKNOWN_TASK
 
+# Extracts the Worklog constructor arguments (in positional order) from a document in one C-level call
+_DOC_GETTER = itemgetter("employee", "log_time", "task_desc", "task", "ticket_link")
+
+# Compiled once at import time. The pattern is anchored on both ends (\Z, unlike $, does not accept a
+# trailing newline) and has no nested quantifiers, so matching is linear in the length of the link.
+_TICKET_LINK_RE = re.compile(r"^https?://\S+\Z")
+
+
+class WorklogValidationError(ValidationError):
+    """Raised when a worklog cannot be created due to invalid input."""
+
+
+class WorklogDBError(Exception):
+    """Raised when a worklog cannot be written to the database."""
+
+
+def _validate_worklog(task_desc: str, log_time: datetime, ticket_link: Optional[str], now: datetime) -> None:
+    """
+    Validates the input of a worklog to be created.
+
+    Args:
+        task_desc (str): The content or description of the worklog.
+        log_time (datetime.datetime): The date and time the worklog refers to.
+        ticket_link (Optional[str]): Optional (related) external ticket link.
+        now (datetime.datetime): The current time, log_time must not be after it.
+
+    Raises:
+        WorklogValidationError: If the description is empty, log_time is in the future or the ticket link is invalid.
+    """
+    if not task_desc:
+        raise WorklogValidationError(_MSG_EMPTY)
+
+    if log_time > now:
+        raise WorklogValidationError(_MSG_FUTURE)
+
+    if ticket_link and not _TICKET_LINK_RE.match(ticket_link):
+        raise WorklogValidationError(_MSG_INVALID_LINK)
+
+
+@functools.lru_cache(maxsize=64)
+def _day_bounds(day: date_type) -> Tuple[datetime, datetime]:
+    """
+    Returns the half-open boundaries [start, end) of the given day (memoized per date).
+
+    Args:
+        day (datetime.date): The date to compute the boundaries for.
+
+    Returns:
+        Tuple[datetime.datetime, datetime.datetime]: The start of the day (00:00:00) and the start of the next day.
+    """
+    return datetime.combine(day, time.min), datetime.combine(day + timedelta(days=1), time.min)
+
+
+def _day_filters(employee_id: str, day: date_type) -> List[list]:
+    """
+    Builds the filters selecting the worklogs of an employee on the given day.
+    The day is expressed as a half-open range (>= start, < next day) instead of BETWEEN,
+    so no microsecond-precise upper bound is needed.
+
+    Args:
+        employee_id (str): ID of the employee.
+        day (datetime.date): The date to filter by.
+
+    Returns:
+        List[list]: Frappe filters in list-of-conditions form.
+    """
+    date_start, next_day_start = _day_bounds(day)
+    return [
+        ["employee", "=", employee_id],
+        ["log_time", ">=", date_start],
+        ["log_time", "<", next_day_start],
+    ]
+
+
+@dataclass(slots=True, frozen=True)
 class Worklog:
     """
     Represents a worklog entry for an employee, including details about the task and the time of work.
@@ -21,18 +106,8 @@ class Worklog:
     employee_id: str
     log_time: datetime
     task_desc: str
-    task: Optional[str]
-    ticket_link: Optional[str]
-
-    def __init__(
-        self, employee_id: str, log_time: datetime, task_desc: str,
-        task: Optional[str] = None, ticket_link: Optional[str] = None
-    ):
-        self.employee_id = employee_id
-        self.log_time = log_time
-        self.task_desc = task_desc
-        self.task = task
-        self.ticket_link = ticket_link
+    task: Optional[str] = None
+    ticket_link: Optional[str] = None
 
 
 class WorklogRepository:
@@ -42,7 +117,9 @@ class WorklogRepository:
     """
 
     _DOCTYPE_NAME = "Worklog"
-    _DOC_FIELDS = ["employee", "log_time", "task_desc", "task", "ticket_link"]
+    _DOC_FIELDS: Tuple[str, ...] = ("employee", "log_time", "task_desc", "task", "ticket_link")
+    _BULK_INSERT_FIELDS = ("name", "employee", "employee_name", "log_time", "task_desc", "task", "ticket_link",
+                           "owner", "creation", "modified", "modified_by")
 
     @staticmethod
     def get_doctype_name() -> str:
@@ -50,32 +127,37 @@ class WorklogRepository:
         return WorklogRepository._DOCTYPE_NAME
 
     @staticmethod
-    def get_doc_fields() -> List[str]:
+    def get_doc_fields() -> Tuple[str, ...]:
         """
-        Returns a copy of the document fields.
+        Returns the document fields (immutable, so no defensive copy is needed).
 
         Returns:
-            List[str]: List of field names used in worklog documents.
+            Tuple[str, ...]: Field names used in worklog documents.
         """
-        return WorklogRepository._DOC_FIELDS.copy()
+        return WorklogRepository._DOC_FIELDS
 
-    def get_worklogs(self, filters: dict) -> List[dict]:
+    def get_worklogs(
+        self, filters: Union[dict, list], fields: Optional[Tuple[str, ...]] = None, limit: Optional[int] = None
+    ) -> List[dict]:
         """
         Retrieves worklogs from the database based on given filters.
 
         Args:
-            filters (dict): Dictionary of filters to apply for retrieving worklogs.
+            filters (Union[dict, list]): Filters (dictionary or list of conditions) to apply for retrieving worklogs.
+            fields (Optional[Tuple[str, ...]]): Columns to fetch, defaults to all document fields.
+                Callers needing fewer columns should pass them, so unneeded columns are not transferred.
+            limit (Optional[int]): Maximum number of worklogs to fetch, defaults to no limit.
 
         Returns:
             List[dict]: A list of worklog entries matching the given filters.
         """
-        return frappe.get_all(
-            WorklogRepository.get_doctype_name(), fields=WorklogRepository.get_doc_fields(), filters=filters
-        )
+        return frappe.get_all(self._DOCTYPE_NAME, fields=fields or self._DOC_FIELDS, filters=filters, limit=limit)
 
     def get_worklogs_of_employee_on_date(self, employee_id: str, date: datetime.date) -> List[Worklog]:
         """
         Retrieves all worklogs for a specific employee on a given date.
+        The query (equality on employee, range on log_time) is designed for the composite
+        (employee, log_time) index of the Worklog table.
 
         Args:
             employee_id (str): ID of the employee whose worklogs are being retrieved.
@@ -84,29 +166,34 @@ class WorklogRepository:
         Returns:
             List[Worklog]: A list of worklogs for the employee on the specified date.
         """
-        worklogs = []
-        # Define the date filter to include the whole day (date_start to date_end)
-        date_start = datetime.combine(date, time(0, 0, 0))
-        date_end = datetime.combine(date, time(23, 59, 59, 999999))
-
         # Fetch worklogs for the employee on the specific date (# Filter logtime by full day)
-        docs = self.get_worklogs({"employee": employee_id, "log_time": ["between", [date_start, date_end]]})
+        docs = self.get_worklogs(_day_filters(employee_id, date))
 
-        if not docs:
-            return []
+        build = self._build_from_doc
+        return [build(doc) for doc in docs]
 
-        for doc in docs:
-            worklogs.append(self._build_from_doc(doc))
+    def has_worklogs_on_date(self, employee_id: str, date: datetime.date) -> bool:
+        """
+        Checks whether a specific employee has any worklogs on a given date.
+        Only a single worklog name is fetched, no Worklog objects are built.
 
-        return worklogs
+        Args:
+            employee_id (str): ID of the employee whose worklogs are being checked.
+            date (datetime.date): The specific date to check.
+
+        Returns:
+            bool: True if at least one worklog exists for the employee on the specified date, False otherwise.
+        """
+        return bool(self.get_worklogs(_day_filters(employee_id, date), fields=("name",), limit=1))
 
     @staticmethod
     def create_worklog(
         employee_id: str, log_time: datetime, worklog_text: str,
         task: Optional[str] = None, ticket_link: Optional[str] = None
-    ) -> Response:
+    ) -> None:
         """
         Creates a new worklog entry for an employee.
+        All input is validated before the Worklog document is allocated.
 
         Args:
             employee_id (str): The ID of the employee creating the worklog.
@@ -115,24 +202,13 @@ class WorklogRepository:
             task (Optional[str]): Optional reference to a specific task associated with the worklog.
             ticket_link (Optional[str]): Optional field to store (related) external ticket link.
 
-        Returns:
-            Response: A Response object indicating the status of the operation.
-                - If successful, the status will be 'success' with a success message.
-                - If an error occurs, the status will be 'error' with a corresponding error message.
-
-
         Raises:
-            ValidationError: If log_time is set in the future.
-            Exception: For other errors during Worklog creation.
+            WorklogValidationError: If the input is invalid (e.g. log_time is set in the future).
+            WorklogDBError: For other errors during Worklog creation (the transaction is rolled back).
         """
+        _validate_worklog(worklog_text, log_time, ticket_link, datetime.now())
 
         try:
-            if not worklog_text:
-                return Response.error(Messages.Worklog.EMPTY_TASK_DESC)
-
-            if log_time > datetime.now():
-                raise ValidationError(Messages.Worklog.ERR_CREATE_WORKLOG_FUTURE_TIME)
-
             new_worklog = frappe.new_doc(WorklogRepository.get_doctype_name())
             new_worklog.employee = employee_id
             new_worklog.log_time = log_time
@@ -141,15 +217,100 @@ class WorklogRepository:
             new_worklog.ticket_link = ticket_link
             new_worklog.save()
 
-            return Response.success(Messages.Worklog.SUCCESS_WORKLOG_CREATION)
-
         except ValidationError as ve:
-            # Handle validation error of log time being in future
-            return Response.error(str(ve))
+            # Handle validation errors raised by the document hooks
+            raise WorklogValidationError(str(ve)) from ve
+
+        except Exception as e:
+            frappe.db.rollback()  # Rollback transaction in case of failure
+            raise WorklogDBError(str(e)) from e
+
+    @staticmethod
+    def bulk_create(worklogs: List[Worklog]) -> None:
+        """
+        Creates several worklog entries with a single bulk INSERT.
+        The names are still reserved one row at a time (one naming series update per row), so callers should bound
+        the number of worklogs per call.
+        Unlike `create_worklog`, the document hooks, permission checks and Link validation are not run by Frappe,
+        so the create permission of the session user is checked and all rows are validated upfront (including the
+        existence of the linked Employees and Tasks): a single invalid row rejects the whole batch.
+
+        Args:
+            worklogs (List[Worklog]): The worklogs to create.
+
+        Raises:
+            frappe.PermissionError: If the session user is not permitted to create worklogs.
+            WorklogValidationError: If any of the worklogs is invalid or links to a non-existent Employee or Task.
+            WorklogDBError: For other errors during Worklog creation (the transaction is rolled back).
+        """
+        frappe.has_permission(WorklogRepository.get_doctype_name(), "create", throw=True)
+
+        now = datetime.now()
+        for worklog in worklogs:
+            _validate_worklog(worklog.task_desc, worklog.log_time, worklog.ticket_link, now)
+
+        if not worklogs:
+            return
+
+        try:
+            employee_names = WorklogRepository._get_employee_names(worklogs)
+            WorklogRepository._check_tasks_exist(worklogs)
+
+            doctype = WorklogRepository.get_doctype_name()
+            autoname = frappe.get_meta(doctype).autoname
+            user = frappe.session.user
+            frappe.db.bulk_insert(doctype, fields=WorklogRepository._BULK_INSERT_FIELDS, values=[
+                (make_autoname(autoname, doctype), worklog.employee_id, employee_names[worklog.employee_id],
+                 worklog.log_time, worklog.task_desc, worklog.task, worklog.ticket_link, user, now, now, user)
+                for worklog in worklogs
+            ])
+
+        except WorklogValidationError:
+            raise
 
         except Exception as e:
             frappe.db.rollback()  # Rollback transaction in case of failure
-            return Response.error(str(e))
+            raise WorklogDBError(str(e)) from e
+
+    @staticmethod
+    def _get_employee_names(worklogs: List[Worklog]) -> dict:
+        """
+        Resolves the names of the Employees of the given worklogs (fetched field) with one query
+        instead of one per row.
+
+        Args:
+            worklogs (List[Worklog]): The worklogs to resolve the Employees of.
+
+        Returns:
+            dict: The employee name by Employee ID.
+
+        Raises:
+            WorklogValidationError: If any of the Employees does not exist.
+        """
+        employee_ids = {worklog.employee_id for worklog in worklogs}
+        employee_names = dict(frappe.get_all(
+            "Employee", filters={"name": ["in", list(employee_ids)]}, fields=["name", "employee_name"], as_list=True
+        ))
+        if not employee_ids.issubset(employee_names):
+            raise WorklogValidationError(_MSG_UNKNOWN_EMPLOYEE)
+        return employee_names
+
+    @staticmethod
+    def _check_tasks_exist(worklogs: List[Worklog]) -> None:
+        """
+        Checks that the Tasks referenced by the given worklogs exist, with one query.
+
+        Args:
+            worklogs (List[Worklog]): The worklogs to check the Tasks of.
+
+        Raises:
+            WorklogValidationError: If any of the Tasks does not exist.
+        """
+        task_ids = {worklog.task for worklog in worklogs if worklog.task}
+        if task_ids and not task_ids.issubset(
+            frappe.get_all("Task", filters={"name": ["in", list(task_ids)]}, pluck="name")
+        ):
+            raise WorklogValidationError(_MSG_UNKNOWN_TASK)
 
     @staticmethod
     def _build_from_doc(doc) -> Worklog:
@@ -162,10 +323,4 @@ class WorklogRepository:
         Returns:
             Worklog: A Worklog object created from the document data.
         """
-        return Worklog(
-            employee_id=doc['employee'],
-            log_time=doc['log_time'],
-            task_desc=doc['task_desc'],
-            task=doc['task'],
-            ticket_link=doc['ticket_link']
-        )
+        return Worklog(*_DOC_GETTER(doc))
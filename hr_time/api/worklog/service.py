@@ -1,12 +1,26 @@
 
 from datetime import datetime, date
-from hr_time.api.worklog.repository import WorklogRepository
+from typing import List
+import frappe
+from hr_time.api.worklog.repository import Worklog, WorklogRepository, WorklogValidationError
 from hr_time.api.employee.api import get_current_employee_id
-from hr_time.api import logger
 from hr_time.api.shared.constants.messages import Messages
 from hr_time.api.shared.utils.response import Response
 
 
+def _request_today() -> date:
+    """
+    Returns today's date, cached in the request-local storage of Frappe (reset at the end of each request).
+
+    Returns:
+        datetime.date: The current date.
+    """
+    today = getattr(frappe.local, "hr_time_today", None)
+    if today is None:
+        today = frappe.local.hr_time_today = date.today()
+    return today
+
+
 class WorklogService:
     """
     Service layer for managing operations related to employee worklogs.
@@ -14,9 +28,13 @@ class WorklogService:
 
     Attributes:
         worklog (WorklogRepository): Repository instance used for interacting with Worklog doctype table.
+        MAX_BATCH_SIZE (int): Maximum number of worklogs created at once by `create_worklogs`.
     """
     worklog: WorklogRepository
 
+    # Bounds the work of a single request: the bulk INSERT still reserves one name (naming series update) per row
+    MAX_BATCH_SIZE = 100
+
     def __init__(self, worklog: WorklogRepository):
         """
         Initializes the WorklogService with a given WorklogRepository.
@@ -47,13 +65,13 @@ class WorklogService:
         Returns:
             bool: True if the employee has worklogs for the current day, False otherwise.
         """
-        today = date.today()
-        worklogs = self.worklog.get_worklogs_of_employee_on_date(employee_id, today)
-        return len(worklogs) > 0
+        today = _request_today()
+        return self.worklog.has_worklogs_on_date(employee_id, today)
 
-    def create_worklog_now(self, employee_id=None, worklog_text='', task=None, ticket_link=None):
+    def create_worklog_now(self, employee_id=None, worklog_text='', task=None, ticket_link=None) -> Response:
         """
         Creates a new worklog for an employee with the given description and optional task reference.
+        Errors are not caught here but raised through to the caller (the API layer).
 
         Args:
             employee_id (Optional[str]): The ID of the employee creating the worklog.
@@ -66,31 +84,56 @@ class WorklogService:
                 Defaults to None.
 
         Returns:
-            dict: A dictionary indicating the success or failure of the worklog creation process.
+            Response: A success response after the worklog has been created.
 
         Raises:
-            ValueError: If the worklog text (task description) is empty.
-            Exception: If any other error occurs during worklog creation.
+            WorklogValidationError: If the worklog text (task description) is empty or any other input is invalid.
+            WorklogDBError: If the worklog could not be stored.
         """
-        try:
-            if employee_id is None:
-                employee_id = get_current_employee_id()
-            if not worklog_text.strip():
-                raise ValueError(Messages.Worklog.EMPTY_TASK_DESC)
+        if employee_id is None:
+            employee_id = get_current_employee_id()
+        if not worklog_text.strip():
+            raise WorklogValidationError(Messages.Worklog.EMPTY_TASK_DESC)
+
+        # Get current time as log_time and call repository to create the worklog
+        self.worklog.create_worklog(employee_id, datetime.now(), worklog_text, task, ticket_link)
+
+        return Response.success(Messages.Worklog.SUCCESS_WORKLOG_CREATION)
 
-            # Get current time as log_time
-            log_time = datetime.now()
-            # Call repository to create the worklog
-            result = self.worklog.create_worklog(employee_id, log_time, worklog_text, task, ticket_link)
+    def create_worklogs(self, entries: List[dict], employee_id=None) -> Response:
+        """
+        Creates several worklogs for an employee at once (with a single bulk INSERT, while the names are still
+        reserved one row at a time). At most `MAX_BATCH_SIZE` worklogs can be created per call.
+        Errors are not caught here but raised through to the caller (the API layer).
 
-            return result
+        Args:
+            entries (List[dict]): The worklogs to create, each with the keys `worklog_text` and optionally
+                `log_time` (defaults to now), `task` and `ticket_link`.
+            employee_id (Optional[str]): The ID of the employee creating the worklogs.
+                If None, the current employee ID is used. Defaults to None.
+
+        Returns:
+            Response: A success response after all worklogs have been created.
+
+        Raises:
+            WorklogValidationError: If there are more than `MAX_BATCH_SIZE` worklogs, the task description of any
+                worklog is empty or any other input is invalid.
+            WorklogDBError: If the worklogs could not be stored.
+        """
+        if len(entries) > self.MAX_BATCH_SIZE:
+            raise WorklogValidationError(Messages.Worklog.ERR_TOO_MANY_WORKLOGS.format(self.MAX_BATCH_SIZE))
+        if employee_id is None:
+            employee_id = get_current_employee_id()
+
+        now = datetime.now()
+        worklogs = []
+        for entry in entries:
+            worklog_text = entry.get("worklog_text") or ""
+            if not worklog_text.strip():
+                raise WorklogValidationError(Messages.Worklog.EMPTY_TASK_DESC)
+            log_time = frappe.utils.get_datetime(entry["log_time"]) if entry.get("log_time") else now
+            worklogs.append(Worklog(employee_id, log_time, worklog_text, entry.get("task"), entry.get("ticket_link")))
 
-        except ValueError as ve:
-            # Handle Empty Task description error
-            logger.error(f"Validation error: {str(ve)}", Messages.Worklog.ERR_CREATE_WORKLOG)
-            return Response.error(str(ve))
+        self.worklog.bulk_create(worklogs)
 
-        except Exception as e:
-            # General error handling
-            logger.error(f"Error : {str(e)}", Messages.Worklog.ERR_CREATE_WORKLOG)
-            return Response.error(str(e))
+        return Response.success(Messages.Worklog.SUCCESS_WORKLOGS_CREATION)
@@ -24,9 +24,15 @@ class Worklog(Document):
         user_id = frappe.session.user
 
         # Get the Employee document where the user_id matches the current user
-        employee = frappe.get_value("Employee", {"user_id": user_id}, "name")
+        # (single-column query, cached for the rest of the request)
+        employee = frappe.db.get_value("Employee", {"user_id": user_id}, "name", cache=True)
 
         if employee:
             self.employee = employee
         else:
             FrappeUtils.throw_error_msg(Messages.Employee.NOT_FOUND_EMPLOYEE)
+
+
+def on_doctype_update():
+    # Worklogs are queried by employee and log_time range, see WorklogRepository
+    frappe.db.add_index("Worklog", ["employee", "log_time"])
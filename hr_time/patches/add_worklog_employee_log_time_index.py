@@ -0,0 +1,6 @@
+from hr_time.hr_time_management.doctype.worklog.worklog import on_doctype_update
+
+
+def execute():
+    # Add the composite (employee, log_time) index to already existing Worklog tables
+    on_doctype_update()
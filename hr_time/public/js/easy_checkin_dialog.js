@@ -338,7 +338,7 @@ export class EasyCheckinDialog {
       },
       callback: (response) => {
         if (response && typeof response === 'object' && response.message) {
-          const res = JSON.parse(response.message)
+          const res = response.message;
           const { status, message: resMessage } = res;
 
           if(typeof status === 'string' && status !== "success"){
@@ -1,4 +1,7 @@
 import sys
+import json
+import itertools
+from datetime import datetime
 from unittest.mock import MagicMock
 
 """
@@ -28,10 +31,18 @@ class FakeDB:
     def rollback():
         FakeLogger.error("DB Rollback")
 
+    @staticmethod
+    def bulk_insert(doctype, fields, values, ignore_duplicates=False):
+        FakeLogger.info(f"DB Bulk insert of {len(values)} {doctype} rows")
+
 
 class FakeUtils:
     logger = FakeLogger()
 
+    @staticmethod
+    def get_datetime(datetime_str):
+        return datetime.fromisoformat(datetime_str)
+
 
 class FakeDocument:
     def __init__(self, name, employee=None, task_desc=None, task=None):
@@ -56,8 +67,23 @@ class FakeDocumentModel:
         raise ValueError(f"Unknown document: {doctype}, {docname}")
 
 
+class FakeNaming:
+    _counter = itertools.count(1)
+
+    @staticmethod
+    def make_autoname(key, doctype=None):
+        # Simulate the naming series by appending a (session-wide) incrementing, zero-padded counter to the prefix
+        return f"{key.split('.')[0]}{next(FakeNaming._counter):05d}"
+
+
+class FakeMeta:
+    def __init__(self, autoname):
+        self.autoname = autoname
+
+
 class FakeModel:
     document = FakeDocumentModel  # Add document class to simulate frappe.model.document
+    naming = FakeNaming  # Add naming class to simulate frappe.model.naming
 
 
 class FakeFrappe(object):
@@ -70,6 +96,17 @@ class FakeFrappe(object):
             self.doc = MagicMock()
             self.doc.email = email
 
+    class local:
+        # Request-local storage, shared by all tests
+        pass
+
+    class session:
+        user = 'test.user@example.com'
+
+    @staticmethod
+    def get_meta(doctype):
+        return FakeMeta(autoname="WL-.#####" if doctype == "Worklog" else "hash")
+
     @staticmethod
     def get_user():
         return FakeFrappe.User(email='test.user@example.com')
@@ -96,6 +133,15 @@ class FakeFrappe(object):
         # Return a no-op decorator that simply returns the function passed to it
         return lambda func: func
 
+    @staticmethod
+    def has_permission(doctype, ptype="read", throw=False):
+        # The test user is permitted everything
+        return True
+
+    @staticmethod
+    def parse_json(val):
+        return json.loads(val) if isinstance(val, str) else val
+
     @staticmethod
     def _(text):
         # A simple translation function for mock
@@ -145,6 +191,12 @@ class FakeFrappe(object):
     class ValidationError(Exception):
         pass
 
+    class PermissionError(Exception):
+        pass
+
 
 # noinspection PyTypeChecker
 sys.modules["frappe"] = FakeFrappe
+# Allow `from frappe.model.naming import ...` although the fake frappe is not a package
+# noinspection PyTypeChecker
+sys.modules["frappe.model.naming"] = FakeNaming
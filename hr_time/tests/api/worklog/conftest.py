@@ -0,0 +1,59 @@
+from unittest.mock import DEFAULT
+import frappe
+import pytest
+from hr_time.api.worklog.repository import WorklogRepository
+from hr_time.api.worklog.service import WorklogService
+
+
+@pytest.fixture(autouse=True)
+def _new_request():
+    """
+    Models the end of a Frappe request before each test: the request-local storage of the fake frappe module
+    lives for the whole test session, so the cached values are cleared.
+    """
+    if hasattr(frappe.local, "hr_time_today"):
+        del frappe.local.hr_time_today
+
+
+@pytest.fixture(scope="module")
+def _patched_frappe(module_mocker):
+    """Patches the frappe functions used by the worklog repository once per test module."""
+    return module_mocker.patch.multiple(frappe, get_all=DEFAULT, new_doc=DEFAULT, get_meta=DEFAULT, db=DEFAULT)
+
+
+@pytest.fixture
+def frappe_mocks(_patched_frappe):
+    """
+    Provides the patched frappe functions (by name), reset before each test
+    including configured return values and side effects.
+    """
+    for mock in _patched_frappe.values():
+        mock.reset_mock(return_value=True, side_effect=True)
+    return _patched_frappe
+
+
+@pytest.fixture
+def mock_get_all(frappe_mocks):
+    return frappe_mocks['get_all']
+
+
+@pytest.fixture
+def mock_new_doc(frappe_mocks):
+    return frappe_mocks['new_doc']
+
+
+@pytest.fixture
+def mock_db(frappe_mocks):
+    return frappe_mocks['db']
+
+
+@pytest.fixture(scope="module")
+def repo():
+    """The repository is stateless, so a single instance is shared by all tests of a module."""
+    return WorklogRepository()
+
+
+@pytest.fixture(scope="module")
+def worklog_stack(repo, _patched_frappe):
+    """Provides a WorklogService on top of a real WorklogRepository, with the frappe functions patched."""
+    return WorklogService(repo)
@@ -1,7 +1,9 @@
 import json
 import unittest
 from unittest.mock import patch
-from hr_time.api.worklog.api import has_employee_made_worklogs_today, create_worklog_now
+from hr_time.api.worklog.api import has_employee_made_worklogs_today, create_worklog_now, create_worklogs
+from hr_time.api.worklog.repository import WorklogRepository
+from hr_time.api.worklog.service import WorklogService
 from hr_time.api.shared.constants.messages import Messages
 import frappe
 from hr_time.api.shared.utils.response import Response
@@ -20,7 +22,12 @@ class TestWorklogAPI(unittest.TestCase):
             "doctype": "Worklog"
         })
 
-    @patch('hr_time.api.worklog.service.WorklogService.check_if_employee_has_worklogs_today')
+    @staticmethod
+    def parse_response(response):
+        # Parse the pre-serialized HTTP body and unwrap Frappe's message envelope
+        return json.loads(response.get_data())['message']
+
+    @patch.object(WorklogService, 'check_if_employee_has_worklogs_today')
     def test_has_employee_made_worklogs_today(self, mock_check_if_has_worklogs):
         # Define test cases with the mock return values and expected results
         test_cases = [
@@ -37,7 +44,7 @@ class TestWorklogAPI(unittest.TestCase):
             # Assert
             self.assertEqual(result, expected)
 
-    @patch('hr_time.api.worklog.service.WorklogService.create_worklog_now')
+    @patch.object(WorklogService, 'create_worklog_now')
     def test_create_worklog_success(self, mock_create_worklog_now):
         # Test for success case
         # Arrange
@@ -48,7 +55,7 @@ class TestWorklogAPI(unittest.TestCase):
         # Act
         result = create_worklog_now(self.DUMMY_EMP_ID, self.DUMMY_VALID_WORKLOG_TEXT,
                                     self.DUMMY_TASK, self.DUMMY_TICKET_LINK)
-        result = json.loads(result)  # Parse JSON string to dictionary
+        result = self.parse_response(result)  # Parse JSON body to dictionary
 
         # Assert
         self.assertEqual(result['status'], Response.STATUS_SUCCESS)
@@ -60,13 +67,13 @@ class TestWorklogAPI(unittest.TestCase):
         # Act
         result = create_worklog_now(self.DUMMY_EMP_ID, self.DUMMY_INVALID_WORKLOG_TEXT,
                                     self.DUMMY_TASK, self.DUMMY_TICKET_LINK)
-        result = json.loads(result)  # Parse JSON string to dictionary
+        result = self.parse_response(result)  # Parse JSON body to dictionary
 
         # Assert
         self.assertEqual(result['status'], Response.STATUS_ERROR)
         self.assertEqual(result['message'], Messages.Worklog.EMPTY_TASK_DESC)   # Expect the error message
 
-    @patch('hr_time.api.worklog.repository.WorklogRepository.create_worklog')
+    @patch.object(WorklogRepository, 'create_worklog')
     def test_create_worklog_general_exception(self, mock_create_worklog):
         # Arrange
         mock_create_worklog.side_effect = Exception(Messages.Common.ERR_DB_CONN)  # Simulate a general exception
@@ -74,13 +81,13 @@ class TestWorklogAPI(unittest.TestCase):
         # Act
         result = create_worklog_now(self.DUMMY_EMP_ID, self.DUMMY_VALID_WORKLOG_TEXT,
                                     self.DUMMY_TASK, self.DUMMY_TICKET_LINK)
-        result = json.loads(result)  # Parse JSON string to dictionary
+        result = self.parse_response(result)  # Parse JSON body to dictionary
 
         # Assert
         self.assertEqual(result['status'], Response.STATUS_ERROR)
         self.assertEqual(result['message'], Messages.Common.ERR_DB_CONN)   # Expect the error message
 
-    @patch('hr_time.api.worklog.service.WorklogService.create_worklog_now')
+    @patch.object(WorklogService, 'create_worklog_now')
     def test_response_format_success(self, mock_create_worklog_now):
         # Arrange
         mock_create_worklog_now.return_value = Response.success(Messages.Worklog.SUCCESS_WORKLOG_CREATION)
@@ -88,7 +95,7 @@ class TestWorklogAPI(unittest.TestCase):
         # Act
         result = create_worklog_now(self.DUMMY_EMP_ID, self.DUMMY_VALID_WORKLOG_TEXT,
                                     self.DUMMY_TASK, self.DUMMY_TICKET_LINK)
-        result_json = json.loads(result)  # Parse JSON string to dictionary
+        result_json = self.parse_response(result)  # Parse JSON body to dictionary
 
         # Assert
         self.assertIsInstance(result_json, dict)
@@ -98,7 +105,7 @@ class TestWorklogAPI(unittest.TestCase):
         self.assertEqual(result_json['status'], Response.STATUS_SUCCESS)
         self.assertEqual(result_json['message'], Messages.Worklog.SUCCESS_WORKLOG_CREATION)
 
-    @patch('hr_time.api.worklog.service.WorklogService.create_worklog_now')
+    @patch.object(WorklogService, 'create_worklog_now')
     def test_response_format_error(self, mock_create_worklog_now):
         # Arrange
         mock_create_worklog_now.return_value = Response.error(Messages.Worklog.ERR_CREATE_WORKLOG)
@@ -106,7 +113,7 @@ class TestWorklogAPI(unittest.TestCase):
         # Act
         result = create_worklog_now(self.DUMMY_EMP_ID, self.DUMMY_VALID_WORKLOG_TEXT,
                                     self.DUMMY_TASK, self.DUMMY_TICKET_LINK)
-        result_json = json.loads(result)  # Parse JSON string to dictionary
+        result_json = self.parse_response(result)  # Parse JSON body to dictionary
 
         # Assert
         self.assertIsInstance(result_json, dict)
@@ -115,3 +122,42 @@ class TestWorklogAPI(unittest.TestCase):
         self.assertIn('data', result_json)  # 'data' can be None
         self.assertEqual(result_json['status'], Response.STATUS_ERROR)
         self.assertEqual(result_json['message'], Messages.Worklog.ERR_CREATE_WORKLOG)
+
+    @patch.object(WorklogRepository, 'bulk_create')
+    def test_create_worklogs(self, mock_bulk_create):
+        # Arrange
+        valid_entry = {'worklog_text': self.DUMMY_VALID_WORKLOG_TEXT, 'log_time': '2024-10-10 09:00:00'}
+        invalid_entry = {'worklog_text': self.DUMMY_INVALID_WORKLOG_TEXT}
+        test_cases = [
+            ([valid_entry, invalid_entry], Response.STATUS_ERROR, Messages.Worklog.EMPTY_TASK_DESC),
+            ([valid_entry], Response.STATUS_SUCCESS, Messages.Worklog.SUCCESS_WORKLOGS_CREATION),
+        ]
+
+        for entries, expected_status, expected_message in test_cases:
+            with self.subTest(expected_status=expected_status):
+                # Act
+                result = self.parse_response(create_worklogs(json.dumps(entries), self.DUMMY_EMP_ID))
+
+                # Assert
+                self.assertEqual(result['status'], expected_status)
+                self.assertEqual(result['message'], expected_message)
+
+        # Only the valid request reaches the repository
+        mock_bulk_create.assert_called_once()
+
+    @patch.object(frappe, 'has_permission')
+    @patch.object(frappe, 'db')
+    def test_create_worklogs_without_permission(self, mock_db, mock_has_permission):
+        # Arrange
+        mock_has_permission.side_effect = frappe.PermissionError('Not permitted')
+        entries = [{'worklog_text': self.DUMMY_VALID_WORKLOG_TEXT}]
+
+        # Act
+        result = self.parse_response(create_worklogs(json.dumps(entries), self.DUMMY_EMP_ID))
+
+        # Assert
+        # The caller is rejected before anything is written
+        self.assertEqual(result['status'], Response.STATUS_ERROR)
+        self.assertEqual(result['message'], 'Not permitted')
+        mock_has_permission.assert_called_once_with('Worklog', 'create', throw=True)
+        mock_db.bulk_insert.assert_not_called()
@@ -0,0 +1,68 @@
+from datetime import datetime
+import pytest
+from hr_time.api.worklog.repository import WorklogValidationError, WorklogDBError
+from hr_time.api.shared.constants.messages import Messages
+from hr_time.api.shared.utils.response import Response
+
+DUMMY_EMP_ID = 'EMP001'
+DUMMY_VALID_WORKLOG_TEXT = 'Completed task A'
+DUMMY_TASK = 'TASK001'
+DUMMY_TICKET_LINK = 'https://github.com/PR/1'
+DUMMY_LOG_TIME = datetime(2024, 10, 10, 9, 0)
+
+
+def _create_via_service(service, worklog_text):
+    return service.create_worklog_now(DUMMY_EMP_ID, worklog_text, DUMMY_TASK, DUMMY_TICKET_LINK)
+
+
+def _create_via_repository(service, worklog_text):
+    return service.worklog.create_worklog(DUMMY_EMP_ID, DUMMY_LOG_TIME, worklog_text, DUMMY_TASK, DUMMY_TICKET_LINK)
+
+
+def test_create_worklog_service_success(worklog_stack, frappe_mocks):
+    # Act
+    result = _create_via_service(worklog_stack, DUMMY_VALID_WORKLOG_TEXT)
+
+    # Assert
+    assert result.status == Response.STATUS_SUCCESS
+    assert result.message == Messages.Worklog.SUCCESS_WORKLOG_CREATION
+    frappe_mocks['new_doc'].return_value.save.assert_called_once()
+    frappe_mocks['db'].rollback.assert_not_called()
+
+
+def test_create_worklog_repository_success(worklog_stack, frappe_mocks):
+    # Act
+    result = _create_via_repository(worklog_stack, DUMMY_VALID_WORKLOG_TEXT)
+
+    # Assert
+    assert result is None
+    frappe_mocks['new_doc'].return_value.save.assert_called_once()
+    frappe_mocks['db'].rollback.assert_not_called()
+
+
+# Each row: how the worklog is created, its input and the error (with message) it must raise, and whether a
+# document is allocated / the transaction is rolled back (no document for invalid input, rollback on DB errors)
+@pytest.mark.parametrize(
+    "create, worklog_text, save_error, expected_error, expected_message, expected_new_doc, expected_rollback", [
+        (_create_via_service, '', None,
+         WorklogValidationError, Messages.Worklog.EMPTY_TASK_DESC, False, False),
+        (_create_via_repository, '', None,
+         WorklogValidationError, Messages.Worklog.EMPTY_TASK_DESC, False, False),
+        (_create_via_service, DUMMY_VALID_WORKLOG_TEXT, Exception(Messages.Common.ERR_DB),
+         WorklogDBError, Messages.Common.ERR_DB, True, True),
+        (_create_via_repository, DUMMY_VALID_WORKLOG_TEXT, Exception(Messages.Common.ERR_DB),
+         WorklogDBError, Messages.Common.ERR_DB, True, True),
+    ], ids=["service-empty", "repository-empty", "service-db_err", "repository-db_err"])
+def test_create_worklog_errors(worklog_stack, frappe_mocks, create, worklog_text, save_error, expected_error,
+                               expected_message, expected_new_doc, expected_rollback):
+    # Arrange
+    frappe_mocks['new_doc'].return_value.save.side_effect = save_error
+
+    # Act
+    with pytest.raises(expected_error) as error:
+        create(worklog_stack, worklog_text)
+
+    # Assert
+    assert str(error.value) == expected_message
+    assert frappe_mocks['new_doc'].called == expected_new_doc
+    assert frappe_mocks['db'].rollback.called == expected_rollback
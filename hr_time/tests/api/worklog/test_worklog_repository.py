@@ -1,151 +1,212 @@
-import unittest
-from unittest.mock import patch, MagicMock
+from types import MappingProxyType
+from unittest.mock import MagicMock
 from datetime import datetime, timedelta
-from hr_time.api.worklog.repository import WorklogRepository, Worklog
+from zoneinfo import ZoneInfo
+import pytest
+import time_machine
+from hr_time.api.worklog import repository as worklog_repository
+from hr_time.api.worklog.repository import WorklogRepository, Worklog, WorklogValidationError
 from hr_time.api.shared.constants.messages import Messages
-from hr_time.api.shared.utils.response import Response
-
-
-class TestWorklogRepository(unittest.TestCase):
-    def setUp(self):
-        self.repo = WorklogRepository()
-        self.DUMMY_EMP_ID = 'EMP001'
-        self.DUMMY_VALID_WORKLOG_TEXT = 'Completed task A'
-        self.DUMMY_INVALID_WORKLOG_TEXT = ''
-        self.DUMMY_TASK = 'TASK001'
-        self.DUMMY_TICKET_LINK = 'github.com/PR/1'
-
-    @patch('frappe.get_all')
-    def test_get_worklogs(self, mock_get_all):
-        # Arrange
-        mock_data = [{'employee': self.DUMMY_EMP_ID, 'log_time': '2023-01-01 10:00:00',
-                      'task_desc': 'Test Task', 'task': 'Task1', 'ticket_link': 'github.com/PR/1'}]
-        # Define the mock method (lambda) to handle all fields defined in frappe framework
-        mock_get_all.side_effect = lambda doctype, fields=None, filters=None, **kwargs: mock_data
-        filters = {'employee': self.DUMMY_EMP_ID}
-
-        # Act
-        worklogs = self.repo.get_worklogs(filters)
-
-        # Assert
-        self.assertEqual(worklogs, mock_data)
-        mock_get_all.assert_called_once_with(self.repo.get_doctype_name(),
-                                             fields=self.repo.get_doc_fields(), filters=filters)
-
-    @patch('frappe.get_all')
-    def test_get_worklogs_of_employee_on_date(self, mock_get_all):
-        # Arrange
-        interested_date = datetime(2024, 10, 10).date()
-        mock_data = [
-            {'employee': self.DUMMY_EMP_ID, 'log_time': datetime(2024, 10, 10, 10, 10, 10),
-             'task_desc': 'Worked on task 1', 'task': 'TASK001', 'ticket_link': 'github.com/PR/1'},
-            {'employee': self.DUMMY_EMP_ID, 'log_time': datetime(2024, 10, 11, 10, 0, 0),
-             'task_desc': 'Worked on task 2', 'task': 'TASK002', 'ticket_link': 'github.com/PR/2'},
-        ]
-
-        # Mocking frappe.get_all to simulate filtering by date
-        mock_get_all.side_effect = lambda doctype, fields=None, filters=None: [
-            entry for entry in mock_data
-            if filters['employee'] == self.DUMMY_EMP_ID
-            and filters['log_time'][1][0] <= entry['log_time'] <= filters['log_time'][1][1]
-        ]
-
-        # Act
-        worklogs = self.repo.get_worklogs_of_employee_on_date(self.DUMMY_EMP_ID, interested_date)
-
-        # Assert
-        self.assertEqual(len(worklogs), 1)  # Expecting only one log entry for 2024-10-10
-        self.assertIsInstance(worklogs[0], Worklog)
-        self.assertEqual(worklogs[0].employee_id, self.DUMMY_EMP_ID)
-        self.assertEqual(worklogs[0].task_desc, 'Worked on task 1')
-        self.assertEqual(worklogs[0].task, 'TASK001')
-        self.assertEqual(worklogs[0].ticket_link, 'github.com/PR/1')
-        # Verifying if correct filters are applied
-        mock_get_all.assert_called_once_with(
-            self.repo.get_doctype_name(), fields=self.repo.get_doc_fields(),
-            filters={
-                'employee': self.DUMMY_EMP_ID,
-                'log_time': ['between', [
-                    datetime.combine(interested_date, datetime.min.time()), datetime.combine(
-                        interested_date, datetime.max.time())
-                ]]
-            }
-        )
-
-    @patch('frappe.new_doc')
-    def test_create_worklog_in_past(self, mock_new_doc):
-        # Arrange
-        mock_worklog_doc = MagicMock()
-        mock_new_doc.return_value = mock_worklog_doc
-        log_time = datetime.now() - timedelta(seconds=1)
-
-        # Act
-        result = self.repo.create_worklog(self.DUMMY_EMP_ID, log_time,
-                                          self.DUMMY_VALID_WORKLOG_TEXT, self.DUMMY_TASK, self.DUMMY_TICKET_LINK)
-
-        # Assert
-        mock_new_doc.assert_called_once_with(self.repo.get_doctype_name())
-        mock_worklog_doc.save.assert_called_once()
-        self.assertEqual(result.status, Response.STATUS_SUCCESS)
-        self.assertEqual(result.message, Messages.Worklog.SUCCESS_WORKLOG_CREATION)
-
-    @patch('frappe.new_doc')
-    def test_create_worklog_now(self, mock_new_doc):
-        # Arrange
-        mock_worklog_doc = MagicMock()
-        mock_new_doc.return_value = mock_worklog_doc
-        log_time = datetime.now()
-
-        # Act
-        result = self.repo.create_worklog(self.DUMMY_EMP_ID, log_time,
-                                          self.DUMMY_VALID_WORKLOG_TEXT, self.DUMMY_TASK, self.DUMMY_TICKET_LINK)
-
-        # Assert
-        mock_new_doc.assert_called_once_with(self.repo.get_doctype_name())
-        mock_worklog_doc.save.assert_called_once()
-        self.assertEqual(result.status, Response.STATUS_SUCCESS)
-        self.assertEqual(result.message, Messages.Worklog.SUCCESS_WORKLOG_CREATION)
-
-    def test_create_worklog_in_future(self):
-        # Arrange
-        log_time = datetime.now() + timedelta(seconds=1)  # Set log_time to 1 second in the future
-
-        # Act
-        result = self.repo.create_worklog(self.DUMMY_EMP_ID, log_time,
-                                          self.DUMMY_VALID_WORKLOG_TEXT, self.DUMMY_TASK, self.DUMMY_TICKET_LINK)
-
-        # Assert
-        # Check that the response indicates a validation error for future log time
-        self.assertEqual(result.status, Response.STATUS_ERROR)
-        self.assertEqual(result.message, Messages.Worklog.ERR_CREATE_WORKLOG_FUTURE_TIME)
-
-    def test_create_worklog_empty_task_description(self):
-        # Arrange
-        log_time = datetime.now() - timedelta(seconds=1)  # Valid log time (in past)
-        worklog_text = ''  # Empty worklog description
-
-        # Act
-        result = self.repo.create_worklog(self.DUMMY_EMP_ID, log_time, worklog_text)
-
-        # Assert
-        self.assertEqual(result.status, Response.STATUS_ERROR)
-        self.assertEqual(result.message, Messages.Worklog.EMPTY_TASK_DESC)
-
-    @patch('frappe.new_doc')
-    @patch('frappe.db.rollback')
-    def test_create_worklog_failure_db(self, mock_rollback, mock_new_doc):
-        # Arrange
-        mock_new_doc.side_effect = Exception(Messages.Common.ERR_DB)  # Simulate a DB error
-        log_time = datetime(2024, 10, 10, 9, 0)
-
-        # Act
-        result = self.repo.create_worklog(self.DUMMY_EMP_ID, log_time,
-                                          self.DUMMY_VALID_WORKLOG_TEXT, self.DUMMY_TASK, self.DUMMY_TICKET_LINK)
-
-        # Assert
-        # Check that result contains the expected error status and message
-        self.assertEqual(result.status, Response.STATUS_ERROR)
-        self.assertEqual(result.message, Messages.Common.ERR_DB)
-
-        # Ensure rollback is called on failure
-        mock_rollback.assert_called_once()
+
+# Frozen "current" time of the clock-dependent tests: datetime.now() returns FROZEN_NOW while traveling
+# (the UTC zone info also mocks the local time zone, so the naive datetime.now() matches FROZEN_NOW)
+FROZEN_NOW = datetime(2024, 10, 10, 12, 0, 0)
+FROZEN_CLOCK = FROZEN_NOW.replace(tzinfo=ZoneInfo('UTC'))
+
+DOCTYPE = WorklogRepository.get_doctype_name()
+FIELDS = WorklogRepository.get_doc_fields()
+DUMMY_EMP_ID = 'EMP001'
+DUMMY_VALID_WORKLOG_TEXT = 'Completed task A'
+DUMMY_INVALID_WORKLOG_TEXT = ''
+DUMMY_TASK = 'TASK001'
+DUMMY_TICKET_LINK = 'https://github.com/PR/1'
+DUMMY_INVALID_TICKET_LINK = 'github.com/PR/1'
+
+# Filters expected for the worklogs of DUMMY_EMP_ID on 2024-10-10
+DAY_FILTERS = [
+    ['employee', '=', DUMMY_EMP_ID],
+    ['log_time', '>=', datetime(2024, 10, 10)],
+    ['log_time', '<', datetime(2024, 10, 11)],
+]
+
+# Read-only worklog rows as returned by frappe.get_all, shared by all tests
+_MOCK_ROW_OCT10 = MappingProxyType({'employee': 'EMP001', 'log_time': datetime(2024, 10, 10, 10, 10, 10),
+                                    'task_desc': 'Worked on task 1', 'task': 'TASK001',
+                                    'ticket_link': 'github.com/PR/1'})
+_MOCK_ROW_OCT11 = MappingProxyType({'employee': 'EMP001', 'log_time': datetime(2024, 10, 11, 10, 0, 0),
+                                    'task_desc': 'Worked on task 2', 'task': 'TASK002',
+                                    'ticket_link': 'github.com/PR/2'})
+_MOCK_DATA = (_MOCK_ROW_OCT10, _MOCK_ROW_OCT11)
+
+
+def _mock_get_all_links(doctype, **kwargs):
+    # Existing link targets of the bulk creation: the Employee DUMMY_EMP_ID and the Task TASK001
+    if doctype == 'Employee':
+        return [(DUMMY_EMP_ID, 'John Doe')]
+    return ['TASK001']
+
+
+def test_get_worklogs(repo, mock_get_all):
+    # Arrange
+    mock_get_all.return_value = _MOCK_DATA
+    filters = {'employee': DUMMY_EMP_ID}
+
+    # Act
+    worklogs = repo.get_worklogs(filters)
+
+    # Assert
+    assert worklogs == _MOCK_DATA
+    mock_get_all.assert_called_once_with(DOCTYPE, fields=FIELDS, filters=filters, limit=None)
+
+
+def test_get_worklogs_of_employee_on_date(repo, mock_get_all):
+    # Arrange
+    interested_date = datetime(2024, 10, 10).date()
+
+    # Mocking frappe.get_all with the result of filtering by date (the applied filters are verified below)
+    mock_get_all.return_value = (_MOCK_ROW_OCT10,)
+
+    # Act
+    worklogs = repo.get_worklogs_of_employee_on_date(DUMMY_EMP_ID, interested_date)
+
+    # Assert
+    assert len(worklogs) == 1  # Expecting only one log entry for 2024-10-10
+    assert isinstance(worklogs[0], Worklog)
+    assert worklogs[0].employee_id == DUMMY_EMP_ID
+    assert worklogs[0].task_desc == 'Worked on task 1'
+    assert worklogs[0].task == 'TASK001'
+    assert worklogs[0].ticket_link == 'github.com/PR/1'
+    # Verifying if correct filters are applied
+    mock_get_all.assert_called_once_with(DOCTYPE, fields=FIELDS, filters=DAY_FILTERS, limit=None)
+
+
+@pytest.mark.parametrize("mock_return, expected", [
+    (['WL-00001'], True),
+    ([], False),
+])
+def test_has_worklogs_on_date(repo, mock_get_all, mock_return, expected):
+    # Arrange
+    interested_date = datetime(2024, 10, 10).date()
+    mock_get_all.return_value = mock_return
+
+    # Act
+    result = repo.has_worklogs_on_date(DUMMY_EMP_ID, interested_date)
+
+    # Assert
+    assert result == expected
+    # Verifying that only a single name is fetched
+    mock_get_all.assert_called_once_with(DOCTYPE, fields=('name',), filters=DAY_FILTERS, limit=1)
+
+
+# The offset of log_time to the current time (in seconds)
+@pytest.mark.parametrize("delta", [-1, 0], ids=["past", "now"])
+@time_machine.travel(FROZEN_CLOCK, tick=False)
+def test_create_worklog_in_past_or_now(repo, mock_new_doc, delta):
+    # Arrange
+    mock_worklog_doc = MagicMock()
+    mock_new_doc.return_value = mock_worklog_doc
+    log_time = FROZEN_NOW + timedelta(seconds=delta)
+
+    # Act
+    repo.create_worklog(DUMMY_EMP_ID, log_time, DUMMY_VALID_WORKLOG_TEXT, DUMMY_TASK, DUMMY_TICKET_LINK)
+
+    # Assert
+    mock_new_doc.assert_called_once_with(DOCTYPE)
+    mock_worklog_doc.save.assert_called_once()
+
+
+@time_machine.travel(FROZEN_CLOCK, tick=False)
+def test_create_worklog_in_future(repo, frappe_mocks):
+    # Arrange
+    log_time = FROZEN_NOW + timedelta(seconds=1)  # Set log_time to 1 second in the future
+
+    # Act
+    with pytest.raises(WorklogValidationError) as error:
+        repo.create_worklog(DUMMY_EMP_ID, log_time, DUMMY_VALID_WORKLOG_TEXT, DUMMY_TASK, DUMMY_TICKET_LINK)
+
+    # Assert
+    # Check that a validation error for future log time is raised
+    assert str(error.value) == Messages.Worklog.ERR_CREATE_WORKLOG_FUTURE_TIME
+
+
+def test_create_worklog_invalid_ticket_link(repo, mock_new_doc):
+    # Arrange
+    log_time = datetime(2024, 10, 10, 9, 0)
+
+    # Act
+    with pytest.raises(WorklogValidationError) as error:
+        repo.create_worklog(DUMMY_EMP_ID, log_time, DUMMY_VALID_WORKLOG_TEXT, DUMMY_TASK, DUMMY_INVALID_TICKET_LINK)
+
+    # Assert
+    assert str(error.value) == Messages.Worklog.ERR_INVALID_TICKET_LINK
+    # No document is allocated for invalid input
+    mock_new_doc.assert_not_called()
+
+
+def test_bulk_create(repo, mock_get_all, mock_db, mocker):
+    # Arrange
+    mocker.patch.object(worklog_repository, 'make_autoname', side_effect=['WL-00001', 'WL-00002'])
+    mock_get_all.side_effect = _mock_get_all_links
+    worklogs = [
+        Worklog(DUMMY_EMP_ID, datetime(2024, 10, 10, 9, 0), 'Worked on task 1', 'TASK001'),
+        Worklog(DUMMY_EMP_ID, datetime(2024, 10, 10, 10, 0), 'Worked on task 2', None, DUMMY_TICKET_LINK),
+    ]
+
+    # Act
+    repo.bulk_create(worklogs)
+
+    # Assert
+    mock_db.bulk_insert.assert_called_once()
+    values = mock_db.bulk_insert.call_args.kwargs['values']
+    assert len(values) == 2
+    assert values[0][:7] == ('WL-00001', DUMMY_EMP_ID, 'John Doe', datetime(2024, 10, 10, 9, 0),
+                             'Worked on task 1', 'TASK001', None)
+    assert values[1][:7] == ('WL-00002', DUMMY_EMP_ID, 'John Doe', datetime(2024, 10, 10, 10, 0),
+                             'Worked on task 2', None, DUMMY_TICKET_LINK)
+    # The links are resolved with one query per linked doctype
+    assert mock_get_all.call_count == 2
+
+
+@pytest.mark.parametrize("worklog, expected_message", [
+    (Worklog('EMP999', datetime(2024, 10, 10, 9, 0), DUMMY_VALID_WORKLOG_TEXT),
+     Messages.Worklog.ERR_UNKNOWN_EMPLOYEE),
+    (Worklog(DUMMY_EMP_ID, datetime(2024, 10, 10, 9, 0), DUMMY_VALID_WORKLOG_TEXT, 'TASK999'),
+     Messages.Worklog.ERR_UNKNOWN_TASK),
+], ids=["unknown_employee", "unknown_task"])
+def test_bulk_create_unknown_links(repo, mock_get_all, mock_db, worklog, expected_message):
+    # Arrange
+    mock_get_all.side_effect = _mock_get_all_links
+    valid_worklog = Worklog(DUMMY_EMP_ID, datetime(2024, 10, 10, 8, 0), DUMMY_VALID_WORKLOG_TEXT, 'TASK001')
+
+    # Act
+    with pytest.raises(WorklogValidationError) as error:
+        repo.bulk_create([valid_worklog, worklog])
+
+    # Assert
+    # The whole batch is rejected, without rolling back
+    assert str(error.value) == expected_message
+    mock_db.bulk_insert.assert_not_called()
+    mock_db.rollback.assert_not_called()
+
+
+@pytest.mark.parametrize("invalid_worklog, expected_message", [
+    (Worklog(DUMMY_EMP_ID, FROZEN_NOW + timedelta(seconds=1), DUMMY_VALID_WORKLOG_TEXT),
+     Messages.Worklog.ERR_CREATE_WORKLOG_FUTURE_TIME),
+    (Worklog(DUMMY_EMP_ID, datetime(2024, 10, 10, 9, 0), DUMMY_INVALID_WORKLOG_TEXT),
+     Messages.Worklog.EMPTY_TASK_DESC),
+    (Worklog(DUMMY_EMP_ID, datetime(2024, 10, 10, 9, 0), DUMMY_VALID_WORKLOG_TEXT, None, DUMMY_INVALID_TICKET_LINK),
+     Messages.Worklog.ERR_INVALID_TICKET_LINK),
+], ids=["future", "empty", "invalid_link"])
+@time_machine.travel(FROZEN_CLOCK, tick=False)
+def test_bulk_create_invalid_rows(repo, mock_db, invalid_worklog, expected_message):
+    # Arrange
+    valid_worklog = Worklog(DUMMY_EMP_ID, datetime(2024, 10, 10, 8, 0), DUMMY_VALID_WORKLOG_TEXT)
+
+    # Act
+    with pytest.raises(WorklogValidationError) as error:
+        repo.bulk_create([valid_worklog, invalid_worklog])
+
+    # Assert
+    # The whole batch is rejected
+    assert str(error.value) == expected_message
+    mock_db.bulk_insert.assert_not_called()
@@ -1,105 +1,139 @@
-import unittest
-from unittest.mock import MagicMock, patch
+from datetime import datetime, date
+from unittest.mock import create_autospec, ANY
+import pytest
+from hr_time.api.worklog import service as worklog_service
 from hr_time.api.worklog.service import WorklogService
-from hr_time.api.worklog.repository import WorklogRepository
+from hr_time.api.worklog.repository import WorklogRepository, Worklog, WorklogValidationError
 from hr_time.api.shared.constants.messages import Messages
 from hr_time.api.shared.utils.response import Response
 
+DUMMY_EMP_ID = '001'
+DUMMY_VALID_WORKLOG_TEXT = 'Completed task A'
+DUMMY_TASK = 'TASK001'
+DUMMY_TICKET_LINK = 'https://github.com/Atlas-Neo/app/issues'
 
-class TestWorklogService(unittest.TestCase):
-    worklog_service: WorklogService
-
-    def setUp(self):
-        super().setUp()
-        # Arrange
-        self.DUMMY_EMP_ID = '001'
-        self.DUMMY_VALID_WORKLOG_TEXT = 'Completed task A'
-        self.DUMMY_INVALID_EMPTY_WORKLOG_TEXT = ''
-        self.DUMMY_TASK = 'TASK001'
-        self.DUMMY_TICKET_LINK = 'https://github.com/Atlas-Neo/app/issues'
-        self.worklog_repository = MagicMock(spec=WorklogRepository)
-        self.worklog_service = WorklogService(self.worklog_repository)
-
-    def test_check_if_employee_has_worklogs_today_true(self):
-        # Arrange
-        # Simulate worklogs for today
-        mock_worklogs = [{'id': '1', 'employee': self.DUMMY_EMP_ID}]
-        self.worklog_repository.get_worklogs_of_employee_on_date.return_value = mock_worklogs
-
-        # Act
-        result = self.worklog_service.check_if_employee_has_worklogs_today(self.DUMMY_EMP_ID)
-
-        # Assert
-        self.assertTrue(result)  # Should return True if there are worklogs
-
-    def test_check_if_employee_has_worklogs_today_false(self):
-        # Arrange
-        self.worklog_repository.get_worklogs_of_employee_on_date.return_value = []  # No worklogs
-
-        # Act
-        result = self.worklog_service.check_if_employee_has_worklogs_today(self.DUMMY_EMP_ID)
-
-        # Assert
-        self.assertFalse(result)
-
-    def test_create_worklog_success(self):
-        # Arrange
-        expected_result = Response.success(Messages.Worklog.SUCCESS_WORKLOG_CREATION)
-        self.worklog_repository.create_worklog.return_value = expected_result
-
-        # Act
-        result = self.worklog_service.create_worklog_now(
-            self.DUMMY_EMP_ID, self.DUMMY_VALID_WORKLOG_TEXT, self.DUMMY_TASK, self.DUMMY_TICKET_LINK)
-
-        # Assert
-        # Verify create_worklog was called
-        self.worklog_repository.create_worklog.assert_called_once()
-        self.assertEqual(result.status, Response.STATUS_SUCCESS)
-        self.assertEqual(result.message, Messages.Worklog.SUCCESS_WORKLOG_CREATION)
-
-    def test_create_worklog_empty_description(self):
-        # Act
-        result = self.worklog_service.create_worklog_now(
-            self.DUMMY_EMP_ID, self.DUMMY_INVALID_EMPTY_WORKLOG_TEXT, self.DUMMY_TASK, self.DUMMY_TICKET_LINK)
-
-        # Assert
-        self.assertEqual(result.status, Response.STATUS_ERROR)
-        self.assertEqual(result.message, Messages.Worklog.EMPTY_TASK_DESC)
-
-    @patch('hr_time.api.worklog.service.get_current_employee_id')
-    def test_create_worklog_with_none_employee_id(self, mock_get_current_emp_id):
-        # Arrange
-        mock_get_current_emp_id.return_value = 'emp123'
-        # Mock the return value of create_worklog to simulate a successful creation
-        expected_result = Response.success(Messages.Worklog.SUCCESS_WORKLOG_CREATION)
-        self.worklog_repository.create_worklog.return_value = expected_result
-
-        # Act
-        result = self.worklog_service.create_worklog_now(
-            employee_id=None, worklog_text=self.DUMMY_VALID_WORKLOG_TEXT,
-            task=self.DUMMY_TASK, ticket_link=self.DUMMY_TICKET_LINK)
-
-        # Assert
-        # Verify that get_current_employee_id was called
-        mock_get_current_emp_id.assert_called_once()
-
-        # Check that create_worklog on repository was called with the correct parameters
-        # i.e. (Current employee ID, ANY date, worklog_text, task)
-        self.worklog_repository.create_worklog.assert_called_once_with(
-            'emp123', unittest.mock.ANY, self.DUMMY_VALID_WORKLOG_TEXT, self.DUMMY_TASK, self.DUMMY_TICKET_LINK)
-
-        # Verify the result is as expected
-        self.assertEqual(result.status, Response.STATUS_SUCCESS)
-        self.assertEqual(result.message, Messages.Worklog.SUCCESS_WORKLOG_CREATION)
-
-    def test_create_worklog_general_exception(self):
-        # Arrange
-        self.worklog_repository.create_worklog.side_effect = Exception(Messages.Common.ERR_DB)
-
-        # Act
-        result = self.worklog_service.create_worklog_now(
-            self.DUMMY_EMP_ID, self.DUMMY_VALID_WORKLOG_TEXT, self.DUMMY_TASK, self.DUMMY_TICKET_LINK)
-
-        # Assert
-        self.assertEqual(result.status, Response.STATUS_ERROR)
-        self.assertEqual(result.message, Messages.Common.ERR_DB)
+
+@pytest.fixture(scope="module")
+def _shared_repository():
+    # The costly spec introspection of the repository class runs only once per module
+    return create_autospec(WorklogRepository, instance=True)
+
+
+@pytest.fixture
+def worklog_repository(_shared_repository):
+    # Reset the shared repository mock, including configured return values and side effects
+    _shared_repository.reset_mock(return_value=True, side_effect=True)
+    return _shared_repository
+
+
+@pytest.fixture(scope="module")
+def service(_shared_repository):
+    # The service only holds the repository, so it is shared by all tests of the module as well
+    return WorklogService(_shared_repository)
+
+
+@pytest.mark.parametrize("has_worklogs", [True, False])
+def test_check_if_employee_has_worklogs_today(service, worklog_repository, has_worklogs):
+    # Arrange
+    worklog_repository.has_worklogs_on_date.return_value = has_worklogs
+
+    # Act
+    result = service.check_if_employee_has_worklogs_today(DUMMY_EMP_ID)
+
+    # Assert
+    assert result is has_worklogs
+
+
+def test_check_if_employee_has_worklogs_today_caches_date(service, worklog_repository, mocker):
+    # Arrange
+    mock_date = mocker.patch.object(worklog_service, 'date')
+    mock_date.today.return_value = date(2024, 10, 10)
+
+    # Act
+    service.check_if_employee_has_worklogs_today(DUMMY_EMP_ID)
+    service.check_if_employee_has_worklogs_today(DUMMY_EMP_ID)
+
+    # Assert
+    # Both checks use the date of the request, which is only determined once
+    assert worklog_repository.has_worklogs_on_date.call_args_list == [
+        mocker.call(DUMMY_EMP_ID, date(2024, 10, 10)),
+        mocker.call(DUMMY_EMP_ID, date(2024, 10, 10)),
+    ]
+    mock_date.today.assert_called_once_with()
+
+
+@pytest.mark.parametrize("employee_id, expected_employee_id", [
+    (DUMMY_EMP_ID, DUMMY_EMP_ID),
+    (None, 'emp123'),  # The current employee ID is used
+])
+def test_create_worklog_success(service, worklog_repository, mocker, employee_id, expected_employee_id):
+    # Arrange
+    mock_get_current_emp_id = mocker.patch.object(worklog_service, 'get_current_employee_id', return_value='emp123')
+
+    # Act
+    result = service.create_worklog_now(employee_id=employee_id, worklog_text=DUMMY_VALID_WORKLOG_TEXT,
+                                        task=DUMMY_TASK, ticket_link=DUMMY_TICKET_LINK)
+
+    # Assert
+    # Verify that get_current_employee_id was only called if no employee ID was given
+    assert mock_get_current_emp_id.called == (employee_id is None)
+
+    # Check that create_worklog on repository was called with the correct parameters
+    # i.e. (Employee ID, ANY date, worklog_text, task, ticket_link)
+    worklog_repository.create_worklog.assert_called_once_with(
+        expected_employee_id, ANY, DUMMY_VALID_WORKLOG_TEXT, DUMMY_TASK, DUMMY_TICKET_LINK)
+
+    # Verify the result is as expected
+    assert result.status == Response.STATUS_SUCCESS
+    assert result.message == Messages.Worklog.SUCCESS_WORKLOG_CREATION
+
+
+def test_create_worklogs(service, worklog_repository, mocker):
+    # Arrange
+    mocker.patch.object(worklog_service, 'get_current_employee_id', return_value='emp123')
+    entries = [
+        {'worklog_text': DUMMY_VALID_WORKLOG_TEXT, 'log_time': '2024-10-10 09:00:00', 'task': DUMMY_TASK},
+        {'worklog_text': 'Completed task B', 'log_time': '2024-10-10 10:00:00', 'ticket_link': DUMMY_TICKET_LINK},
+    ]
+
+    # Act
+    result = service.create_worklogs(entries)
+
+    # Assert
+    # All worklogs are created for the current employee with one bulk insert
+    worklog_repository.bulk_create.assert_called_once_with([
+        Worklog('emp123', datetime(2024, 10, 10, 9, 0), DUMMY_VALID_WORKLOG_TEXT, DUMMY_TASK),
+        Worklog('emp123', datetime(2024, 10, 10, 10, 0), 'Completed task B', None, DUMMY_TICKET_LINK),
+    ])
+    assert result.status == Response.STATUS_SUCCESS
+    assert result.message == Messages.Worklog.SUCCESS_WORKLOGS_CREATION
+
+
+def test_create_worklogs_empty_description(service, worklog_repository):
+    # Arrange
+    entries = [
+        {'worklog_text': DUMMY_VALID_WORKLOG_TEXT},
+        {'worklog_text': ' '},
+    ]
+
+    # Act
+    with pytest.raises(WorklogValidationError) as error:
+        service.create_worklogs(entries, DUMMY_EMP_ID)
+
+    # Assert
+    # The whole batch is rejected
+    assert str(error.value) == Messages.Worklog.EMPTY_TASK_DESC
+    worklog_repository.bulk_create.assert_not_called()
+
+
+def test_create_worklogs_too_many(service, worklog_repository):
+    # Arrange
+    entries = [{'worklog_text': DUMMY_VALID_WORKLOG_TEXT}] * (WorklogService.MAX_BATCH_SIZE + 1)
+
+    # Act
+    with pytest.raises(WorklogValidationError) as error:
+        service.create_worklogs(entries, DUMMY_EMP_ID)
+
+    # Assert
+    assert str(error.value) == Messages.Worklog.ERR_TOO_MANY_WORKLOGS.format(WorklogService.MAX_BATCH_SIZE)
+    worklog_repository.bulk_create.assert_not_called()
@@ -0,0 +1,4 @@
+# Install the fake frappe module (see hr_time/tests/api/__init__.py) before pytest collects any test module,
+# so that test modules importing hr_time.api can be collected independent of their package.
+# pytest collects the unittest-style test classes as they are.
+import hr_time.tests.api  # noqa: F401